@@ -1,11 +1,22 @@
 from __future__ import annotations
 
+import html
 import pathlib
 import shlex
 import threading
 
-from PySide6.QtCore import QSize, Qt, Signal
-from PySide6.QtGui import QFont, QIcon, QTextCursor
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QEvent,
+    QModelIndex,
+    QRect,
+    QSize,
+    QSortFilterProxyModel,
+    Qt,
+    QTimer,
+    Signal,
+)
+from PySide6.QtGui import QColor, QFont, QIcon, QStandardItem, QStandardItemModel, QTextCursor
 from PySide6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -16,6 +27,7 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QListView,
     QListWidget,
     QListWidgetItem,
     QMessageBox,
@@ -23,6 +35,9 @@ from PySide6.QtWidgets import (
     QPushButton,
     QSpinBox,
     QStackedWidget,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionButton,
     QTextBrowser,
     QVBoxLayout,
     QWidget,
@@ -39,7 +54,7 @@ from .services import (
     normalize_app_name,
     search_artwork_suggestions,
 )
-from .theme import LOG_LEVEL_COLORS
+from .theme import LOG_LEVEL_COLORS, THEME_COLORS
 from .widgets import SectionCard, add_shadow, build_app_artwork_pixmap
 
 
@@ -49,6 +64,13 @@ def _apply_variant(button: QPushButton, variant: str) -> None:
     button.style().polish(button)
 
 
+def _add_runtime_items(combo: QComboBox, installed_tags: list[str], label_format: str) -> None:
+    offset = combo.count()
+    combo.addItems([label_format.format(tag) for tag in installed_tags])
+    for row, tag in enumerate(installed_tags, start=offset):
+        combo.setItemData(row, tag)
+
+
 def _make_chip(text: str, accent: bool = False) -> QLabel:
     label = QLabel(text)
     label.setProperty("chip", True)
@@ -208,50 +230,129 @@ class GamescopeEditor(QFrame):
         )
 
 
-class ReleaseRow(QFrame):
-    def __init__(self, release: ProtonRelease, installed: bool, action_callback, parent=None):
+class ReleaseListModel(QAbstractListModel):
+    """Backs the Proton hub release list without a widget per row."""
+
+    TagRole = Qt.UserRole
+    NameRole = Qt.UserRole + 1
+    DateRole = Qt.UserRole + 2
+    InstalledRole = Qt.UserRole + 3
+    FilterRole = Qt.UserRole + 4
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.setObjectName("ReleaseCard")
-        add_shadow(self, blur=12, alpha=12)
+        self.releases: list[ProtonRelease] = []
+        self.installed: set[str] = set()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.releases)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self.releases):
+            return None
+        release = self.releases[index.row()]
+        if role in (Qt.DisplayRole, self.TagRole):
+            return release.tag
+        if role == self.NameRole:
+            return release.name
+        if role == self.DateRole:
+            return release.published_text
+        if role == self.InstalledRole:
+            return release.tag in self.installed
+        if role == self.FilterRole:
+            return f"{release.tag} {release.name}"
+        return None
+
+    def set_releases(self, releases: list[ProtonRelease]) -> None:
+        self.beginResetModel()
+        self.releases = list(releases)
+        self.endResetModel()
+
+    def set_installed(self, tags: list[str]) -> None:
+        updated = set(tags)
+        if updated == self.installed:
+            return
+        self.installed = updated
+        if self.releases:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self.releases) - 1, 0),
+                [self.InstalledRole],
+            )
 
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(12, 10, 12, 10)
-        layout.setSpacing(10)
 
-        text_layout = QVBoxLayout()
-        text_layout.setSpacing(2)
+class ReleaseItemDelegate(QStyledItemDelegate):
+    """Paints a release row with its state chip and Install/Remove button.
 
-        top_row = QHBoxLayout()
-        top_row.setSpacing(8)
+    Rows are drawn on demand for the visible viewport only, so no widgets
+    are allocated per release.
+    """
 
-        tag_label = QLabel(release.tag)
-        tag_label.setObjectName("SectionTitle")
-        top_row.addWidget(tag_label, 0, Qt.AlignVCenter)
+    ROW_HEIGHT = 56
 
-        date_label = QLabel(release.published.strftime("%Y-%m-%d"))
-        date_label.setObjectName("MutedText")
-        top_row.addWidget(date_label, 0, Qt.AlignVCenter)
-        top_row.addStretch()
-        text_layout.addLayout(top_row)
+    def __init__(self, action_callback, parent=None):
+        super().__init__(parent)
+        self._action_callback = action_callback
 
-        name_label = QLabel(release.name)
-        name_label.setObjectName("MutedText")
-        name_label.setWordWrap(True)
-        text_layout.addWidget(name_label)
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
 
-        layout.addLayout(text_layout, 1)
+    @staticmethod
+    def _content_rect(option_rect: QRect) -> QRect:
+        return option_rect.adjusted(4, 3, -4, -3)
 
-        state_chip = _make_chip("Installed" if installed else "Available", accent=installed)
-        state_chip.setMinimumWidth(88)
-        state_chip.setAlignment(Qt.AlignCenter)
-        layout.addWidget(state_chip, 0, Qt.AlignVCenter)
+    @staticmethod
+    def _button_rect(content_rect: QRect) -> QRect:
+        return QRect(content_rect.right() - 98, content_rect.center().y() - 15, 86, 30)
 
-        self.action_button = QPushButton("Remove" if installed else "Install")
-        _apply_variant(self.action_button, "danger" if installed else "secondary")
-        self.action_button.setMinimumWidth(86)
-        self.action_button.setFixedHeight(30)
-        self.action_button.clicked.connect(lambda: action_callback(release.tag, installed))
-        layout.addWidget(self.action_button, 0, Qt.AlignVCenter)
+    def paint(self, painter, option, index) -> None:
+        tag = index.data(ReleaseListModel.TagRole)
+        if tag is None:
+            super().paint(painter, option, index)
+            return
+        installed = bool(index.data(ReleaseListModel.InstalledRole))
+        name = index.data(ReleaseListModel.NameRole) or ""
+        date_text = index.data(ReleaseListModel.DateRole) or ""
+
+        painter.save()
+        rect = self._content_rect(option.rect)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        painter.fillRect(rect, QColor(THEME_COLORS["surface_alt" if hovered else "surface"]))
+
+        text_rect = rect.adjusted(12, 8, -220, -8)
+        title_font = QFont(option.font)
+        title_font.setBold(True)
+        painter.setFont(title_font)
+        painter.setPen(QColor(THEME_COLORS["text"]))
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignTop, f"{tag}   {date_text}")
+
+        painter.setFont(option.font)
+        painter.setPen(QColor(THEME_COLORS["muted"]))
+        elided = painter.fontMetrics().elidedText(name, Qt.ElideRight, text_rect.width())
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignBottom, elided)
+
+        chip_rect = QRect(rect.right() - 204, rect.center().y() - 13, 92, 26)
+        painter.setPen(QColor(THEME_COLORS["accent" if installed else "muted"]))
+        painter.drawText(chip_rect, Qt.AlignCenter, "Installed" if installed else "Available")
+
+        button = QStyleOptionButton()
+        button.rect = self._button_rect(rect)
+        button.text = "Remove" if installed else "Install"
+        button.state = QStyle.State_Enabled
+        QApplication.style().drawControl(QStyle.CE_PushButton, button, painter)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            rect = self._content_rect(option.rect)
+            if self._button_rect(rect).contains(event.position().toPoint()):
+                tag = index.data(ReleaseListModel.TagRole)
+                if tag:
+                    self._action_callback(tag, bool(index.data(ReleaseListModel.InstalledRole)))
+                return True
+        return super().editorEvent(event, model, option, index)
 
 
 class ProtonHubDialog(QDialog):
@@ -312,9 +413,19 @@ class ProtonHubDialog(QDialog):
         activity_row.addWidget(self.progress_bar)
         root.addLayout(activity_row)
 
-        self.release_list = QListWidget()
+        self.release_model = ReleaseListModel(self)
+        self.release_proxy = QSortFilterProxyModel(self)
+        self.release_proxy.setSourceModel(self.release_model)
+        self.release_proxy.setFilterRole(ReleaseListModel.FilterRole)
+        self.release_proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+
+        self.release_list = QListView()
         self.release_list.setObjectName("CompactReleaseList")
-        self.release_list.setSpacing(6)
+        self.release_list.setModel(self.release_proxy)
+        self.release_list.setItemDelegate(ReleaseItemDelegate(self.on_action_requested, self.release_list))
+        self.release_list.setSelectionMode(QListView.NoSelection)
+        self.release_list.setUniformItemSizes(True)
+        self.release_list.setMouseTracking(True)
         root.addWidget(self.release_list, 1)
 
         close_row = QHBoxLayout()
@@ -341,11 +452,13 @@ class ProtonHubDialog(QDialog):
 
     def on_remote_ready(self, releases: list[ProtonRelease]) -> None:
         self.releases = releases
+        self.release_model.set_releases(releases)
         self.refresh_list()
         self._complete_refresh_step()
 
     def on_installed_ready(self, tags: list[str]) -> None:
         self.installed = set(tags)
+        self.release_model.set_installed(tags)
         self.refresh_list()
         self._complete_refresh_step()
 
@@ -370,24 +483,7 @@ class ProtonHubDialog(QDialog):
             self._set_activity()
 
     def refresh_list(self) -> None:
-        self.release_list.clear()
-        query = self.search_edit.text().strip().lower()
-        visible = 0
-
-        for release in self.releases:
-            haystack = f"{release.tag} {release.name}".lower()
-            if query and query not in haystack:
-                continue
-
-            item = QListWidgetItem()
-            row = ReleaseRow(release, release.tag in self.installed, self.on_action_requested)
-            item.setSizeHint(row.sizeHint())
-            self.release_list.addItem(item)
-            self.release_list.setItemWidget(item, row)
-            visible += 1
-
-        if visible == 0:
-            self.release_list.addItem("No Proton versions match this filter.")
+        self.release_proxy.setFilterFixedString(self.search_edit.text().strip())
 
         proton_dir = pathlib.Path(self.pm.proton_dir)
         location = proton_dir.name or str(proton_dir)
@@ -429,7 +525,32 @@ class ProtonHubDialog(QDialog):
             QMessageBox.critical(self, "Removal Failed", f"{tag}\n\n{message}")
 
 
+class _AppFilterProxy(QSortFilterProxyModel):
+    """Filters the scanned app model by search text and the system-file toggle."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.hide_system = True
+        self.setFilterCaseSensitivity(Qt.CaseInsensitive)
+
+    def set_hide_system(self, hide_system: bool) -> None:
+        if hide_system == self.hide_system:
+            return
+        self.hide_system = hide_system
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if self.hide_system:
+            index = self.sourceModel().index(source_row, 0, source_parent)
+            if index.data(AppsDialog.SystemRole):
+                return False
+        return super().filterAcceptsRow(source_row, source_parent)
+
+
 class AppsDialog(QDialog):
+    PathRole = Qt.UserRole
+    SystemRole = Qt.UserRole + 1
+
     def __init__(self, prefix: str, scanner: ProgramScanner, cached_apps: list[str], launch_callback, parent=None):
         super().__init__(parent)
         self.prefix = prefix
@@ -452,9 +573,14 @@ class AppsDialog(QDialog):
         filters = QHBoxLayout()
         filters.setSpacing(10)
 
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self.filter_apps)
+
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText("Search apps")
-        self.search_edit.textChanged.connect(self.filter_apps)
+        self.search_edit.textChanged.connect(self._filter_timer.start)
         filters.addWidget(self.search_edit, 1)
 
         self.hide_system = QCheckBox("Hide system files")
@@ -472,9 +598,17 @@ class AppsDialog(QDialog):
         self.count_label.setObjectName("MutedText")
         root.addWidget(self.count_label)
 
-        self.app_list = QListWidget()
-        self.app_list.currentItemChanged.connect(self.update_selection)
-        self.app_list.itemDoubleClicked.connect(lambda _: self.launch_selected())
+        self.app_model = QStandardItemModel(self)
+        self.app_proxy = _AppFilterProxy(self)
+        self.app_proxy.setSourceModel(self.app_model)
+        self.app_proxy.setFilterRole(self.PathRole)
+
+        self.app_list = QListView()
+        self.app_list.setUniformItemSizes(True)
+        self.app_list.setEditTriggers(QListView.NoEditTriggers)
+        self.app_list.setModel(self.app_proxy)
+        self.app_list.selectionModel().currentChanged.connect(self.update_selection)
+        self.app_list.doubleClicked.connect(lambda _index: self.launch_selected())
         root.addWidget(self.app_list, 1)
 
         self.path_label = QLabel("No application selected")
@@ -501,59 +635,68 @@ class AppsDialog(QDialog):
         root.addLayout(button_row)
 
         self.scanner.scanned.connect(self.on_scanned)
+        self.scanner.scannedBatch.connect(self.on_scanned_batch)
         self.update_selection()
 
         if self.all_apps:
+            self.populate_model()
             self.filter_apps()
         else:
             self.start_scan(force=False)
 
     def start_scan(self, force: bool) -> None:
         self.count_label.setText("Scanning prefix...")
-        self.app_list.clear()
-        self.app_list.addItem("Scanning installed applications...")
+        self.all_apps = []
+        self.app_model.setRowCount(0)
         self.scanner.scan(self.prefix, force=force)
 
+    def on_scanned_batch(self, prefix: str, batch: list[str]) -> None:
+        if prefix != self.prefix:
+            return
+        self.all_apps.extend(batch)
+        self.append_rows(batch)
+        visible = self.app_proxy.rowCount()
+        if visible > 0 and not self.app_list.currentIndex().isValid():
+            self.app_list.setCurrentIndex(self.app_proxy.index(0, 0))
+        self.count_label.setText(f"Scanning... {visible} applications visible | {len(self.all_apps)} found so far")
+        self.update_selection()
+
     def on_scanned(self, prefix: str, apps: list[str]) -> None:
         if prefix != self.prefix:
             return
         self.all_apps = apps
+        self.populate_model()
         self.filter_apps()
 
-    def filter_apps(self) -> None:
-        self.app_list.clear()
-        query = self.search_edit.text().strip().lower()
-        hide_system = self.hide_system.isChecked()
-        visible = 0
-
-        for app_path in self.all_apps:
-            lower = app_path.lower()
-            if hide_system and is_system_executable(lower, app_path):
-                continue
-            if query and query not in lower:
-                continue
+    def populate_model(self) -> None:
+        self.app_model.setRowCount(0)
+        self.append_rows(self.all_apps)
 
-            visible += 1
+    def append_rows(self, apps: list[str]) -> None:
+        for app_path in apps:
             name = pathlib.Path(app_path).name
-            item = QListWidgetItem(f"{name}\n{app_path}")
-            item.setData(Qt.UserRole, app_path)
+            item = QStandardItem(f"{name}\n{app_path}")
+            item.setData(app_path, self.PathRole)
+            item.setData(is_system_executable(app_path.lower(), app_path), self.SystemRole)
             item.setToolTip(app_path)
-            self.app_list.addItem(item)
+            item.setEditable(False)
+            self.app_model.appendRow(item)
 
-        if visible == 0:
-            self.app_list.addItem("No applications match this filter.")
+    def filter_apps(self) -> None:
+        self.app_proxy.set_hide_system(self.hide_system.isChecked())
+        self.app_proxy.setFilterFixedString(self.search_edit.text().strip())
 
-        self.count_label.setText(f"{visible} applications visible | {len(self.all_apps)} cached total")
+        visible = self.app_proxy.rowCount()
         if visible > 0:
-            self.app_list.setCurrentRow(0)
-        else:
-            self.update_selection()
+            self.app_list.setCurrentIndex(self.app_proxy.index(0, 0))
+        self.count_label.setText(f"{visible} applications visible | {len(self.all_apps)} cached total")
+        self.update_selection()
 
     def current_path(self) -> str | None:
-        item = self.app_list.currentItem()
-        if not item:
+        index = self.app_list.currentIndex()
+        if not index.isValid():
             return None
-        return item.data(Qt.UserRole)
+        return index.data(self.PathRole)
 
     def update_selection(self, *_args) -> None:
         current = self.current_path()
@@ -753,8 +896,7 @@ class LaunchExeDialog(QDialog):
         self.runtime_combo = QComboBox()
         self.runtime_combo.addItem("Use prefix/default runtime", "__inherit__")
         self.runtime_combo.addItem("System Wine", "")
-        for tag in installed_tags:
-            self.runtime_combo.addItem(f"Proton {tag}", tag)
+        _add_runtime_items(self.runtime_combo, installed_tags, "Proton {}")
         self.runtime_combo.currentIndexChanged.connect(self.refresh_preview)
         runtime_row.addWidget(self.runtime_combo, 1)
         launch_card.body.addLayout(runtime_row)
@@ -1069,25 +1211,32 @@ class AppArtworkDialog(QDialog):
     def populate_suggestions(self, selected_path: str = "") -> None:
         current_override = self.current_override_path()
         current_override_zoom = self.current_override_zoom()
-        self.suggestion_list.clear()
 
-        custom_paths: list[tuple[str, str, str]] = []
-        if current_override:
-            custom_paths.append(("Current artwork", pathlib.Path(current_override).name, current_override))
-        if self._browsed_art_path and self._browsed_art_path != current_override:
-            custom_paths.append(("Chosen file", pathlib.Path(self._browsed_art_path).name, self._browsed_art_path))
+        self.suggestion_list.setUpdatesEnabled(False)
+        self.suggestion_list.blockSignals(True)
+        try:
+            self.suggestion_list.clear()
 
-        for title, subtitle, art_path in custom_paths:
-            default_zoom = current_override_zoom if art_path == current_override else 0
-            self._add_suggestion_item(title, subtitle, art_path, art_path, default_zoom=default_zoom)
+            custom_paths: list[tuple[str, str, str]] = []
+            if current_override:
+                custom_paths.append(("Current artwork", pathlib.Path(current_override).name, current_override))
+            if self._browsed_art_path and self._browsed_art_path != current_override:
+                custom_paths.append(("Chosen file", pathlib.Path(self._browsed_art_path).name, self._browsed_art_path))
 
-        self._add_suggestion_item("Executable icon", "Use the executable or theme icon", "", "", supports_zoom=False)
+            for title, subtitle, art_path in custom_paths:
+                default_zoom = current_override_zoom if art_path == current_override else 0
+                self._add_suggestion_item(title, subtitle, art_path, art_path, default_zoom=default_zoom)
 
-        seen_paths = {path for _, _, path in custom_paths if path}
-        for suggestion in self.remote_suggestions:
-            if suggestion.image_path in seen_paths:
-                continue
-            self._add_suggestion_item(suggestion.title, suggestion.source, suggestion.image_path, suggestion.attribution)
+            self._add_suggestion_item("Executable icon", "Use the executable or theme icon", "", "", supports_zoom=False)
+
+            seen_paths = {path for _, _, path in custom_paths if path}
+            for suggestion in self.remote_suggestions:
+                if suggestion.image_path in seen_paths:
+                    continue
+                self._add_suggestion_item(suggestion.title, suggestion.source, suggestion.image_path, suggestion.attribution)
+        finally:
+            self.suggestion_list.blockSignals(False)
+            self.suggestion_list.setUpdatesEnabled(True)
 
         target_path = selected_path or self._browsed_art_path or current_override
         if not self._select_matching_item(target_path):
@@ -1293,8 +1442,7 @@ class AppPosterSettingsDialog(QDialog):
         self.runtime_combo = QComboBox()
         self.runtime_combo.addItem("Inherit from prefix", "__inherit__")
         self.runtime_combo.addItem("System Wine", "")
-        for tag in self.installed_tags:
-            self.runtime_combo.addItem(f"Proton {tag}", tag)
+        _add_runtime_items(self.runtime_combo, self.installed_tags, "Proton {}")
         self.runtime_combo.currentIndexChanged.connect(self.on_runtime_changed)
         runtime_row.addWidget(self.runtime_combo, 1)
         root.addLayout(runtime_row)
@@ -1501,6 +1649,7 @@ class SettingsDialog(QDialog):
 
         self.settings_nav = QListWidget()
         self.settings_nav.setObjectName("SettingsNav")
+        self.settings_nav.setUniformItemSizes(True)
         self.settings_nav.setFixedWidth(190)
         self.settings_nav.addItems(["Global Defaults", "Prefix Overrides", "Prefix Sources"])
         content.addWidget(self.settings_nav)
@@ -1533,8 +1682,7 @@ class SettingsDialog(QDialog):
         runtime_card = SectionCard("Default Runtime", "Used unless a prefix or app overrides it.")
         self.default_runtime_combo = QComboBox()
         self.default_runtime_combo.addItem("System Wine", "")
-        for tag in installed_tags:
-            self.default_runtime_combo.addItem(f"Proton {tag}", tag)
+        _add_runtime_items(self.default_runtime_combo, installed_tags, "Proton {}")
         current = self.default_runtime_combo.findData(self.config.default_runtime)
         self.default_runtime_combo.setCurrentIndex(current if current >= 0 else 0)
         runtime_card.body.addWidget(self.default_runtime_combo)
@@ -1587,8 +1735,7 @@ class SettingsDialog(QDialog):
         self.prefix_override_combo = QComboBox()
         self.prefix_override_combo.addItem("Use global default", "__inherit__")
         self.prefix_override_combo.addItem("Always use System Wine", "")
-        for tag in installed_tags:
-            self.prefix_override_combo.addItem(f"Always use Proton {tag}", tag)
+        _add_runtime_items(self.prefix_override_combo, installed_tags, "Always use Proton {}")
         prefix_row.addWidget(self.prefix_override_combo, 1)
         prefix_card.body.addLayout(prefix_row)
 
@@ -1644,6 +1791,7 @@ class SettingsDialog(QDialog):
         )
         self.roots_list = QListWidget()
         self.roots_list.setObjectName("PrefixSourceList")
+        self.roots_list.setUniformItemSizes(True)
         for directory in self.config.extra_prefix_dirs():
             self.roots_list.addItem(directory)
         roots_card.body.addWidget(self.roots_list)
@@ -1856,14 +2004,19 @@ class LogsDialog(QDialog):
         controls = QHBoxLayout()
         controls.setSpacing(10)
 
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self.refresh_logs)
+
         self.level_combo = QComboBox()
         self.level_combo.addItems(["All", "INFO", "WARNING", "ERROR", "DEBUG"])
-        self.level_combo.currentTextChanged.connect(self.refresh_logs)
+        self.level_combo.currentTextChanged.connect(self._filter_timer.start)
         controls.addWidget(self.level_combo)
 
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText("Search logs")
-        self.search_edit.textChanged.connect(self.refresh_logs)
+        self.search_edit.textChanged.connect(self._filter_timer.start)
         controls.addWidget(self.search_edit, 1)
 
         clear_button = QPushButton("Clear")
@@ -1882,6 +2035,7 @@ class LogsDialog(QDialog):
         root.addWidget(header)
 
         self.log_view = QTextBrowser()
+        self.log_view.document().setMaximumBlockCount(self.logger.max_logs)
         mono_font = QFont("Monospace")
         mono_font.setStyleHint(QFont.Monospace)
         self.log_view.setFont(mono_font)
@@ -1901,17 +2055,22 @@ class LogsDialog(QDialog):
         self.logger.logUpdated.connect(self.on_log_updated)
         self.refresh_logs()
 
+    def done(self, result: int) -> None:
+        # The dialog object outlives exec() through its parent; stop re-rendering
+        # the document for log traffic nobody can see.
+        try:
+            self.logger.logUpdated.disconnect(self.on_log_updated)
+        except (RuntimeError, TypeError):
+            pass
+        super().done(result)
+
     def matching_logs(self) -> list[str]:
         level = self.level_combo.currentText()
         query = self.search_edit.text().strip().lower()
-        result: list[str] = []
-        for entry in self.logger.logs:
-            if level != "All" and f"[{level}]" not in entry:
-                continue
-            if query and query not in entry.lower():
-                continue
-            result.append(entry)
-        return result
+        entries = self.logger.entries(level)
+        if not query:
+            return entries
+        return [entry for entry in entries if query in entry.lower()]
 
     def refresh_logs(self) -> None:
         matches = self.matching_logs()
@@ -1925,9 +2084,9 @@ class LogsDialog(QDialog):
                 color = LOG_LEVEL_COLORS["INFO"]
             else:
                 color = LOG_LEVEL_COLORS["DEFAULT"]
-            html_lines.append(f'<span style="color:{color};">{entry}</span>')
+            html_lines.append(f'<div style="color:{color};">{html.escape(entry)}</div>')
 
-        self.log_view.setHtml("<br>".join(html_lines))
+        self.log_view.setHtml("".join(html_lines))
         cursor = self.log_view.textCursor()
         cursor.movePosition(QTextCursor.End)
         self.log_view.setTextCursor(cursor)
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import os
 import pathlib
+import threading
+from functools import partial
 
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtWidgets import (
     QCheckBox,
     QDialog,
@@ -59,6 +62,8 @@ def _decorate_chip(label: QLabel, accent: bool = False) -> None:
 
 
 class WineManagerWindow(QMainWindow):
+    prefixesDiscovered = Signal(list)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Wine Manager")
@@ -76,8 +81,10 @@ class WineManagerWindow(QMainWindow):
         self.app_entries: list[AppEntry] = []
         self.app_entries_by_key: dict[str, AppEntry] = {}
         self.app_cards: dict[str, AppCard] = {}
+        self._card_pool: list[AppCard] = []
         self.filtered_app_entries: list[AppEntry] = []
         self._scanning_prefixes: set[str] = set()
+        self._entries_dirty = False
         self._last_columns = 0
         self._rendered_count = 0
         self._settings_prefix_hint: str | None = None
@@ -93,7 +100,7 @@ class WineManagerWindow(QMainWindow):
         self._connect_signals()
 
         self.logger.add("INFO", "Wine Manager started", "System")
-        self.refresh_prefixes()
+        QTimer.singleShot(0, self.refresh_prefixes)
 
     def _build_ui(self) -> None:
         frame = QWidget()
@@ -270,6 +277,7 @@ class WineManagerWindow(QMainWindow):
         self.search_edit.textChanged.connect(self.schedule_render_app_wall)
         self.favorites_only.stateChanged.connect(self.schedule_render_app_wall)
         self.hide_system_apps.stateChanged.connect(self.schedule_render_app_wall)
+        self.prefixesDiscovered.connect(self.on_prefixes_discovered)
         self.pm.installedReady.connect(self.on_installed_ready)
         self.scanner.scanStarted.connect(self.on_scan_started)
         self.scanner.scanned.connect(self.on_apps_scanned)
@@ -293,7 +301,20 @@ class WineManagerWindow(QMainWindow):
 
     def refresh_prefixes(self) -> None:
         self.statusBar().showMessage("Searching prefixes...")
-        self.prefixes = discover_prefixes(self.config, self.logger)
+        self.refresh_button.setEnabled(False)
+        threading.Thread(target=self._discover_prefixes, daemon=True).start()
+
+    def _discover_prefixes(self) -> None:
+        try:
+            prefixes = discover_prefixes(self.config, self.logger)
+        except RuntimeError:
+            # The interpreter is shutting down while discovery is in flight.
+            return
+        self.prefixesDiscovered.emit(prefixes)
+
+    def on_prefixes_discovered(self, prefixes: list[str]) -> None:
+        self.prefixes = prefixes
+        self.refresh_button.setEnabled(True)
         self._settings_prefix_hint = self.prefixes[0] if self.prefixes else None
         self.pm.refresh_directory()
         self.pm.query_installed()
@@ -304,7 +325,7 @@ class WineManagerWindow(QMainWindow):
 
     def on_installed_ready(self, tags: list[str]) -> None:
         self.installed_tags = tags
-        self.update_app_entries()
+        self.schedule_update_app_entries()
 
     def on_scan_started(self, prefix: str) -> None:
         self._scanning_prefixes.add(prefix)
@@ -314,12 +335,25 @@ class WineManagerWindow(QMainWindow):
 
     def on_apps_scanned(self, prefix: str, _apps: list[str]) -> None:
         self._scanning_prefixes.discard(prefix)
-        self.update_app_entries()
+        self.schedule_update_app_entries()
 
     def on_log_updated(self, entry: str) -> None:
-        self.statusBar().showMessage(entry)
+        self.statusBar().showMessage(entry.rsplit("\n", 1)[-1])
+
+    def schedule_update_app_entries(self) -> None:
+        if self._entries_dirty:
+            return
+        self._entries_dirty = True
+        QTimer.singleShot(0, self._flush_update_app_entries)
+
+    def _flush_update_app_entries(self) -> None:
+        if not self._entries_dirty:
+            return
+        self._entries_dirty = False
+        self.update_app_entries()
 
     def update_app_entries(self) -> None:
+        self._entries_dirty = False
         self.app_entries = aggregate_apps(self.prefixes, self.scanner.cache, self.config, self.installed_tags)
         self.app_entries_by_key = {entry.key: entry for entry in self.app_entries}
         self.refresh_header_stats()
@@ -359,14 +393,15 @@ class WineManagerWindow(QMainWindow):
         query = self.search_edit.text().strip().lower()
         favorites_only = self.favorites_only.isChecked()
         hide_system_apps = self.hide_system_apps.isChecked()
+        if not query and not favorites_only and not hide_system_apps:
+            return list(self.app_entries)
         result: list[AppEntry] = []
         for entry in self.app_entries:
             if favorites_only and not entry.is_favorite:
                 continue
             if hide_system_apps and is_system_executable(entry.exe_path, entry.display_name):
                 continue
-            haystack = f"{entry.display_name} {entry.exe_path} {pathlib.Path(entry.prefix).name}".lower()
-            if query and query not in haystack:
+            if query and query not in entry.search_key:
                 continue
             result.append(entry)
         return result
@@ -378,12 +413,32 @@ class WineManagerWindow(QMainWindow):
         while self.grid_layout.count():
             item = self.grid_layout.takeAt(0)
             widget = item.widget()
-            if widget is not None:
+            if widget is None:
+                continue
+            if isinstance(widget, AppCard):
+                self._recycle_card(widget)
+            else:
                 widget.deleteLater()
         self.app_cards.clear()
         self._rendered_count = 0
         self._is_appending = False
 
+    def _recycle_card(self, card: AppCard) -> None:
+        for signal in (
+            card.playRequested,
+            card.settingsRequested,
+            card.favoriteToggled,
+            card.removeRequested,
+            card.artClicked,
+        ):
+            try:
+                signal.disconnect()
+            except (RuntimeError, TypeError):
+                pass
+        card.hide()
+        card.setParent(None)
+        self._card_pool.append(card)
+
     def schedule_render_app_wall(self) -> None:
         self._render_timer.start()
 
@@ -433,7 +488,7 @@ class WineManagerWindow(QMainWindow):
         start_index = self._rendered_count
         for index in range(start_index, target_count):
             entry = entries[index]
-            card = AppCard()
+            card = self._card_pool.pop() if self._card_pool else AppCard()
             card.set_content(
                 entry.display_name,
                 self.poster_meta(entry),
@@ -444,13 +499,14 @@ class WineManagerWindow(QMainWindow):
                 entry.is_favorite,
                 self.poster_tooltip(entry),
             )
-            card.playRequested.connect(lambda entry=entry: self.launch_entry(entry))
-            card.settingsRequested.connect(lambda entry=entry: self.open_app_settings(entry))
-            card.favoriteToggled.connect(lambda checked, entry=entry: self.toggle_entry_favorite(entry, checked))
-            card.removeRequested.connect(lambda entry=entry: self.confirm_remove_entry(entry))
-            card.artClicked.connect(lambda entry=entry: self.open_app_artwork(entry))
+            card.playRequested.connect(partial(self.launch_entry, entry))
+            card.settingsRequested.connect(partial(self.open_app_settings, entry))
+            card.favoriteToggled.connect(partial(self.toggle_entry_favorite, entry))
+            card.removeRequested.connect(partial(self.confirm_remove_entry, entry))
+            card.artClicked.connect(partial(self.open_app_artwork, entry))
             self.app_cards[entry.key] = card
             self.grid_layout.addWidget(card, index // columns, index % columns)
+            card.show()
 
         self._rendered_count = target_count
         self.grid_host.adjustSize()
@@ -529,7 +585,11 @@ class WineManagerWindow(QMainWindow):
         else:
             self.config.remove_favorite(entry.prefix, entry.exe_path)
             self.statusBar().showMessage(f"{entry.display_name} removed from favorites")
-        self.update_app_entries()
+        entry.is_favorite = is_favorite
+        self.app_entries.sort(
+            key=lambda item: (not item.is_favorite, item.display_name.lower(), os.path.basename(item.prefix).lower())
+        )
+        self.schedule_render_app_wall()
 
     def show_add_app_dialog(self) -> None:
         if not self.prefixes:
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import atexit
 import json
 import os
 import hashlib
 import pathlib
+import queue
+import re
 import shlex
 import shutil
 import subprocess
@@ -12,18 +15,45 @@ import tempfile
 import threading
 import time
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter, Retry
 from PySide6.QtCore import QObject, QTimer, Signal
 
+try:
+    from isal import igzip as _igzip
+except ImportError:
+    _igzip = None
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def _json_dumps(data: object) -> bytes:
+    if _orjson is not None:
+        return _orjson.dumps(data, option=_orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _json_loads(raw: bytes | str):
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    return json.loads(raw)
+
 
 CONFIG_DIR = pathlib.Path.home() / ".config" / "wine-manager"
 CONFIG_FILE = CONFIG_DIR / "settings.json"
 POSTER_CACHE_DIR = CONFIG_DIR / "posters"
 POSTER_INDEX_FILE = CONFIG_DIR / "poster-cache.json"
+RELEASES_CACHE_FILE = CONFIG_DIR / "releases-cache.json"
+LOG_FILE = CONFIG_DIR / "wine-manager.log"
 GITHUB_API = "https://api.github.com/repos/GloriousEggroll/proton-ge-custom/releases"
 STEAM_STORE_SEARCH_API = "https://store.steampowered.com/api/storesearch"
 STEAM_APPDETAILS_API = "https://store.steampowered.com/api/appdetails"
@@ -83,6 +113,37 @@ REQUEST_HEADERS = {
     "Accept": "application/vnd.github+json",
     "User-Agent": "wine-manager/2.0",
 }
+SCAN_SKIP_DIRS = {"windows", "programdata"}
+_ERROR_TOKENS_RE = re.compile(r"error|failed|exception", re.IGNORECASE)
+_SYSTEM_PATH_RE = re.compile(r"[\\/](?:windows|system32)[\\/]", re.IGNORECASE)
+
+
+def _build_http_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_HTTP_SESSION = _build_http_session()
+_DOWNLOAD_POOL = urllib3.PoolManager(maxsize=2)
+
+
+_timestamp_cache: tuple[int, str] = (0, "")
+
+
+def _timestamp() -> str:
+    """Format the current time, reusing the string while the second is unchanged."""
+    global _timestamp_cache
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache = (now, time.strftime("%H:%M:%S"))
+    return _timestamp_cache[1]
 
 
 def _safe_emit(signal, *args) -> None:
@@ -193,26 +254,30 @@ class GamescopeSettings:
 
 class ConfigStore:
     def __init__(self):
+        self._save_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._last_digest: Optional[bytes] = None
         self.data = self._load()
+        atexit.register(self._flush_on_exit)
 
     def _load(self) -> dict:
-        if not CONFIG_FILE.exists():
-            CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-            CONFIG_FILE.write_text(json.dumps(_default_config(), indent=2), encoding="utf-8")
-
         try:
-            raw = json.loads(CONFIG_FILE.read_text(encoding="utf-8"))
+            raw = _json_loads(CONFIG_FILE.read_bytes())
+        except FileNotFoundError:
+            CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+            CONFIG_FILE.write_bytes(_json_dumps(_default_config()))
+            raw = {}
         except Exception:
             raw = {}
 
         config = _default_config()
         config.update(raw)
-        config["proton_dir"] = str(pathlib.Path(os.path.expanduser(config["proton_dir"])))
+        config["proton_dir"] = os.path.normpath(os.path.expanduser(config["proton_dir"]))
         config["proton_launch_backend"] = "direct" if str(config.get("proton_launch_backend", "umu")).strip().lower() == "direct" else "umu"
         config["umu_executable"] = str(config.get("umu_executable") or "umu-run").strip() or "umu-run"
         config["gamescope_defaults"] = _normalize_gamescope_settings(config.get("gamescope_defaults", {}))
         config["extra_prefix_dirs"] = [
-            str(pathlib.Path(os.path.expanduser(path))) for path in config.get("extra_prefix_dirs", [])
+            os.path.normpath(os.path.expanduser(path)) for path in config.get("extra_prefix_dirs", [])
         ]
         config["prefix_hidden_apps"] = {
             prefix: list(paths) for prefix, paths in config.get("prefix_hidden_apps", {}).items()
@@ -238,7 +303,7 @@ class ConfigStore:
             for app_key, settings in config.get("app_gamescope_map", {}).items()
         }
         config["app_art_map"] = {
-            app_key: str(pathlib.Path(os.path.expanduser(path)))
+            app_key: os.path.normpath(os.path.expanduser(path))
             for app_key, path in config.get("app_art_map", {}).items()
             if path
         }
@@ -250,15 +315,52 @@ class ConfigStore:
         return config
 
     def save(self) -> None:
-        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        CONFIG_FILE.write_text(json.dumps(self.data, indent=2), encoding="utf-8")
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(0.5, self._flush_save)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _flush_on_exit(self) -> None:
+        with self._save_lock:
+            timer = self._save_timer
+            self._save_timer = None
+        if timer is None:
+            return
+        timer.cancel()
+        self._flush_save()
+
+    def _flush_save(self) -> None:
+        with self._save_lock:
+            self._save_timer = None
+            try:
+                serialized = _json_dumps(self.data)
+            except RuntimeError:
+                # A mutation on the GUI thread raced the dump; retry on a fresh timer.
+                self._save_timer = threading.Timer(0.5, self._flush_save)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+                return
+        digest = hashlib.blake2b(serialized, digest_size=16).digest()
+        if digest == self._last_digest:
+            return
+        try:
+            CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+            descriptor, tmp_path = tempfile.mkstemp(dir=CONFIG_DIR, prefix=".settings-", suffix=".tmp")
+            with os.fdopen(descriptor, "wb") as handle:
+                handle.write(serialized)
+            os.replace(tmp_path, CONFIG_FILE)
+            self._last_digest = digest
+        except Exception as error:
+            print(f"Could not save settings: {error}", file=__import__("sys").stderr)
 
     @property
     def proton_dir(self) -> pathlib.Path:
         return pathlib.Path(self.data["proton_dir"])
 
     def set_proton_dir(self, directory: str) -> None:
-        self.data["proton_dir"] = str(pathlib.Path(os.path.expanduser(directory)))
+        self.data["proton_dir"] = os.path.normpath(os.path.expanduser(directory))
         self.save()
 
     @property
@@ -364,8 +466,8 @@ class ConfigStore:
         path = self.data.get("app_art_map", {}).get(app_key)
         if not path:
             return None
-        normalized = str(pathlib.Path(os.path.expanduser(path)))
-        if pathlib.Path(normalized).exists():
+        normalized = os.path.normpath(os.path.expanduser(path))
+        if os.path.exists(normalized):
             return normalized
         return None
 
@@ -376,7 +478,7 @@ class ConfigStore:
             mapping.pop(app_key, None)
             self.data.setdefault("app_art_zoom_map", {}).pop(app_key, None)
         else:
-            mapping[app_key] = str(pathlib.Path(os.path.expanduser(art_path)))
+            mapping[app_key] = os.path.normpath(os.path.expanduser(art_path))
         self.save()
 
     def app_art_zoom(self, prefix: str, exe_path: str) -> int:
@@ -400,7 +502,7 @@ class ConfigStore:
         return list(self.data.get("extra_prefix_dirs", []))
 
     def add_prefix_dir(self, directory: str) -> bool:
-        normalized = str(pathlib.Path(os.path.expanduser(directory)))
+        normalized = os.path.normpath(os.path.expanduser(directory))
         entries = self.data.setdefault("extra_prefix_dirs", [])
         if normalized in entries:
             return False
@@ -409,7 +511,7 @@ class ConfigStore:
         return True
 
     def remove_prefix_dir(self, directory: str) -> bool:
-        normalized = str(pathlib.Path(os.path.expanduser(directory)))
+        normalized = os.path.normpath(os.path.expanduser(directory))
         entries = self.data.setdefault("extra_prefix_dirs", [])
         if normalized not in entries:
             return False
@@ -526,28 +628,81 @@ class ConfigStore:
 
 class LogManager(QObject):
     logUpdated = Signal(str)
+    _flushRequested = Signal()
 
     def __init__(self):
         super().__init__()
-        self.logs: list[str] = []
         self.max_logs = 1000
+        self.logs: deque[str] = deque(maxlen=self.max_logs)
+        self.by_level: dict[str, deque[str]] = {}
+        self._pending: list[str] = []
+        self._pending_lock = threading.Lock()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush_pending)
+        self._flushRequested.connect(self._schedule_flush)
+        self._disk_queue: queue.Queue[str] = queue.Queue()
+        threading.Thread(target=self._disk_flush_loop, daemon=True).start()
 
     def add(self, level: str, message: str, source: str = "App") -> None:
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        entry = f"[{timestamp}] [{level}] [{source}] {message}"
+        entry = f"[{_timestamp()}] [{level}] [{source}] {message}"
         self.logs.append(entry)
-        if len(self.logs) > self.max_logs:
-            self.logs = self.logs[-self.max_logs :]
-        self.logUpdated.emit(entry)
+        bucket = self.by_level.get(level)
+        if bucket is None:
+            bucket = self.by_level[level] = deque(maxlen=self.max_logs)
+        bucket.append(entry)
+        with self._pending_lock:
+            self._pending.append(entry)
+        self._disk_queue.put(entry)
+        self._flushRequested.emit()
         stream = None if level in {"INFO", "DEBUG"} else __import__("sys").stderr
         print(entry, file=stream)
 
+    def _disk_flush_loop(self) -> None:
+        while True:
+            entries = [self._disk_queue.get()]
+            time.sleep(0.2)
+            while True:
+                try:
+                    entries.append(self._disk_queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+                with open(LOG_FILE, "a", encoding="utf-8") as handle:
+                    handle.write("\n".join(entries) + "\n")
+            except OSError:
+                pass
+
+    def _schedule_flush(self) -> None:
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_pending(self) -> None:
+        with self._pending_lock:
+            pending = self._pending
+            self._pending = []
+        if pending:
+            self.logUpdated.emit("\n".join(pending))
+
     def clear(self) -> None:
         self.logs.clear()
+        self.by_level.clear()
         self.logUpdated.emit("Logs cleared")
 
+    def entries(self, level: str = "All") -> list[str]:
+        if level == "All":
+            return list(self.logs)
+        return list(self.by_level.get(level, ()))
+
+    def count(self, level: str = "All") -> int:
+        if level == "All":
+            return len(self.logs)
+        return len(self.by_level.get(level, ()))
+
     def recent(self, limit: int = 8) -> list[str]:
-        return list(self.logs[-limit:])
+        return list(self.logs)[-limit:]
 
     def dump(self) -> str:
         return "\n".join(self.logs)
@@ -559,6 +714,11 @@ class ProtonRelease:
     name: str
     published: datetime
     asset_url: str
+    published_text: str = ""
+
+    def __post_init__(self) -> None:
+        if not self.published_text:
+            self.published_text = self.published.strftime("%Y-%m-%d")
 
 
 @dataclass(slots=True)
@@ -569,6 +729,7 @@ class AppEntry:
     display_name: str
     runtime_tag: str
     is_favorite: bool
+    search_key: str = ""
 
 
 @dataclass(slots=True)
@@ -592,8 +753,7 @@ def normalize_app_name(value: str) -> str:
 
 
 def is_system_executable(exe_path: str, display_name: str = "") -> bool:
-    lower_path = exe_path.lower()
-    if any(part in lower_path for part in ["/windows/", "\\windows\\", "/system32/", "\\system32\\"]):
+    if _SYSTEM_PATH_RE.search(exe_path):
         return True
 
     normalized_name = normalize_app_name(display_name or exe_path).strip().lower()
@@ -696,7 +856,7 @@ def _build_artwork_name_variants(app_name: str) -> list[str]:
 
 def _query_steam_artwork_candidates(query: str, app_name: str) -> list[dict]:
     try:
-        response = requests.get(
+        response = _HTTP_SESSION.get(
             STEAM_STORE_SEARCH_API,
             headers=REQUEST_HEADERS,
             params={"term": query, "l": "english", "cc": "us"},
@@ -773,7 +933,7 @@ def _fetch_steam_artwork_url(app_id: int, fallback_thumbnail: str) -> tuple[str,
         return fallback_thumbnail, "search", ""
 
     try:
-        response = requests.get(
+        response = _HTTP_SESSION.get(
             STEAM_APPDETAILS_API,
             headers=REQUEST_HEADERS,
             params={"appids": str(app_id), "l": "english", "cc": "us"},
@@ -804,7 +964,7 @@ def _series_markers(value: str) -> set[str]:
 
 def _query_wikimedia_artwork_candidates(query: str, app_name: str) -> list[dict]:
     try:
-        response = requests.get(
+        response = _HTTP_SESSION.get(
             WIKIMEDIA_COMMONS_API,
             headers=REQUEST_HEADERS,
             params={
@@ -890,7 +1050,7 @@ def _download_cached_artwork(url: str, image_id: str) -> str:
     if target.exists() and target.stat().st_size > 0:
         return str(target)
 
-    response = requests.get(url, headers=REQUEST_HEADERS, timeout=20)
+    response = _HTTP_SESSION.get(url, headers=REQUEST_HEADERS, timeout=20)
     response.raise_for_status()
     target.write_bytes(response.content)
     return str(target)
@@ -904,38 +1064,47 @@ def aggregate_apps(
 ) -> list[AppEntry]:
     entries: dict[str, AppEntry] = {}
     installed = set(installed_tags)
+    favorites_map = config.data.get("prefix_favorites", {})
+    hidden_map = config.data.get("prefix_hidden_apps", {})
+    manual_map = config.data.get("prefix_manual_apps", {})
+    prefix_proton_map = config.data.get("prefix_proton_map", {})
+    app_proton_map = config.data.get("app_proton_map", {})
+    default_runtime = config.default_runtime
 
     for prefix in prefixes:
-        override = config.runtime_override(prefix)
-        prefix_runtime = config.default_runtime if override is None else override
+        override = prefix_proton_map.get(prefix)
+        prefix_runtime = default_runtime if override is None else override
         if prefix_runtime and prefix_runtime not in installed:
             prefix_runtime = ""
 
-        favorites = set(config.favorites_for(prefix))
-        hidden_apps = set(config.hidden_apps_for(prefix))
+        favorites = set(favorites_map.get(prefix, []))
+        hidden_apps = set(hidden_map.get(prefix, []))
         known_apps: list[str] = []
         seen_paths: set[str] = set()
-        for exe_path in [*config.manual_apps_for(prefix), *favorites, *scanner_cache.get(prefix, [])]:
+        for exe_path in [*manual_map.get(prefix, []), *favorites, *scanner_cache.get(prefix, [])]:
             if exe_path in seen_paths:
                 continue
             seen_paths.add(exe_path)
             known_apps.append(exe_path)
 
+        prefix_name = os.path.basename(prefix)
         for exe_path in known_apps:
             if exe_path in hidden_apps:
                 continue
             key = f"{prefix}::{exe_path}"
-            app_runtime = config.app_runtime_override(prefix, exe_path)
+            app_runtime = app_proton_map.get(key)
             runtime_tag = prefix_runtime if app_runtime is None else app_runtime
             if runtime_tag and runtime_tag not in installed:
                 runtime_tag = ""
+            display_name = normalize_app_name(exe_path)
             entries[key] = AppEntry(
                 key=key,
                 prefix=prefix,
                 exe_path=exe_path,
-                display_name=normalize_app_name(exe_path),
+                display_name=display_name,
                 runtime_tag=runtime_tag,
                 is_favorite=exe_path in favorites,
+                search_key=f"{display_name} {exe_path} {prefix_name}".lower(),
             )
 
     return sorted(
@@ -943,52 +1112,91 @@ def aggregate_apps(
         key=lambda entry: (
             not entry.is_favorite,
             entry.display_name.lower(),
-            pathlib.Path(entry.prefix).name.lower(),
+            os.path.basename(entry.prefix).lower(),
         ),
     )
 
 
+_prefix_cache: dict[tuple, list[str]] = {}
+
+
 def discover_prefixes(config: ConfigStore, logger: LogManager) -> list[str]:
-    home = pathlib.Path.home()
+    home = os.path.expanduser("~")
     roots = [
-        home / ".wine",
-        home / ".local/share/wineprefixes",
-        home / ".local/share/bottles/bottles",
-        home / ".local/share/bottles/data/bottles",
-        home / ".var/app/com.usebottles.bottles/data/bottles",
-        home / ".var/app/com.usebottles.bottles/data/bottles/bottles",
+        os.path.join(home, ".wine"),
+        os.path.join(home, ".local/share/wineprefixes"),
+        os.path.join(home, ".local/share/bottles/bottles"),
+        os.path.join(home, ".local/share/bottles/data/bottles"),
+        os.path.join(home, ".var/app/com.usebottles.bottles/data/bottles"),
+        os.path.join(home, ".var/app/com.usebottles.bottles/data/bottles/bottles"),
     ]
-    roots.extend(pathlib.Path(path) for path in config.extra_prefix_dirs())
+    roots.extend(config.extra_prefix_dirs())
 
-    prefixes: set[str] = set()
+    seen_roots: set[str] = set()
+    unique_roots: list[str] = []
     for root in roots:
-        if not root.exists():
+        real = os.path.realpath(root)
+        if real in seen_roots:
             continue
+        seen_roots.add(real)
+        unique_roots.append(root)
+    roots = unique_roots
 
-        if (root / "system.reg").exists():
-            prefixes.add(str(root))
-
+    mtimes = []
+    for root in roots:
         try:
-            for child in root.iterdir():
-                if not child.is_dir():
-                    continue
-                if (child / "system.reg").exists():
-                    prefixes.add(str(child))
-                elif (child / "prefix" / "system.reg").exists():
-                    prefixes.add(str(child / "prefix"))
-        except PermissionError:
-            logger.add("WARNING", f"Permission denied while scanning {root}", "PrefixDiscovery")
-        except Exception as error:
-            logger.add("WARNING", f"Failed to scan {root}: {error}", "PrefixDiscovery")
+            mtimes.append(os.stat(root).st_mtime_ns)
+        except OSError:
+            mtimes.append(0)
+    cache_key = (tuple(roots), tuple(mtimes))
+    cached = _prefix_cache.get(cache_key)
+    if cached is not None:
+        logger.add("INFO", f"Prefix roots unchanged, reusing {len(cached)} discovered prefixes", "PrefixDiscovery")
+        return list(cached)
+
+    prefixes: set[str] = set()
+    with ThreadPoolExecutor(max_workers=min(8, max(1, len(roots)))) as executor:
+        for found in executor.map(lambda root: _scan_prefix_root(root, logger), roots):
+            prefixes.update(found)
 
     logger.add("INFO", f"Discovered {len(prefixes)} Wine prefixes", "PrefixDiscovery")
-    return sorted(prefixes)
+    result = sorted(prefixes)
+    _prefix_cache.clear()
+    _prefix_cache[cache_key] = result
+    return list(result)
+
+
+def _scan_prefix_root(root: str, logger: LogManager) -> set[str]:
+    found: set[str] = set()
+    if not os.path.isdir(root):
+        return found
+
+    if os.path.isfile(os.path.join(root, "system.reg")):
+        found.add(root)
+
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                if os.path.isfile(os.path.join(entry.path, "system.reg")):
+                    found.add(entry.path)
+                elif os.path.isfile(os.path.join(entry.path, "prefix", "system.reg")):
+                    found.add(os.path.join(entry.path, "prefix"))
+    except PermissionError:
+        logger.add("WARNING", f"Permission denied while scanning {root}", "PrefixDiscovery")
+    except Exception as error:
+        logger.add("WARNING", f"Failed to scan {root}: {error}", "PrefixDiscovery")
+    return found
 
 
 class ProgramScanner(QObject):
     scanned = Signal(str, list)
+    scannedBatch = Signal(str, list)
     scanStarted = Signal(str)
 
+    BATCH_SIZE = 200
+
     def __init__(self, logger: LogManager):
         super().__init__()
         self.logger = logger
@@ -1010,15 +1218,64 @@ class ProgramScanner(QObject):
 
         apps: list[str] = []
         if drive.exists():
-            for file_path in drive.rglob("*.exe"):
-                if file_path.is_file():
-                    apps.append(str(file_path))
+            apps = self._walk_drive(prefix, str(drive))
 
-        apps.sort(key=lambda entry: pathlib.Path(entry).name.lower())
+        apps.sort(key=lambda entry: os.path.basename(entry).lower())
         self.cache[prefix] = apps
         self.logger.add("INFO", f"Indexed {len(apps)} applications in {prefix}", "ProgramScanner")
         _safe_emit(self.scanned, prefix, apps)
 
+    def _walk_drive(self, prefix: str, drive_root: str) -> list[str]:
+        """Walk drive_c with a shared directory queue so stat latency overlaps across threads."""
+        pending: queue.Queue[Optional[str]] = queue.Queue()
+        pending.put(drive_root)
+        apps: list[str] = []
+        batch: list[str] = []
+        lock = threading.Lock()
+
+        def worker() -> None:
+            nonlocal batch
+            while True:
+                directory = pending.get()
+                if directory is None:
+                    pending.task_done()
+                    return
+                found: list[str] = []
+                try:
+                    with os.scandir(directory) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                if directory == drive_root and entry.name.lower() in SCAN_SKIP_DIRS:
+                                    continue
+                                pending.put(entry.path)
+                            elif entry.name[-4:].lower() == ".exe" and entry.is_file(follow_symlinks=False):
+                                found.append(entry.path)
+                except OSError:
+                    pass
+                flushed: list[str] = []
+                if found:
+                    with lock:
+                        apps.extend(found)
+                        batch.extend(found)
+                        if len(batch) >= self.BATCH_SIZE:
+                            flushed, batch = batch, []
+                if flushed:
+                    _safe_emit(self.scannedBatch, prefix, flushed)
+                pending.task_done()
+
+        workers = [threading.Thread(target=worker, daemon=True) for _ in range(min(8, (os.cpu_count() or 2) * 2))]
+        for thread in workers:
+            thread.start()
+        pending.join()
+        for _ in workers:
+            pending.put(None)
+        for thread in workers:
+            thread.join()
+
+        if batch:
+            _safe_emit(self.scannedBatch, prefix, batch)
+        return apps
+
 
 class PosterService(QObject):
     posterReady = Signal(str, str, str)
@@ -1164,7 +1421,7 @@ class PosterService(QObject):
 
     def _query_wikimedia_commons(self, query: str, app_name: str) -> Optional[dict]:
         try:
-            response = requests.get(
+            response = _HTTP_SESSION.get(
                 WIKIMEDIA_COMMONS_API,
                 headers=REQUEST_HEADERS,
                 params={
@@ -1255,13 +1512,40 @@ class PosterService(QObject):
         return ranked[0][1]
 
     def _download_thumbnail(self, url: str, image_id: str) -> str:
-        response = requests.get(url, headers=REQUEST_HEADERS, timeout=20)
+        response = _HTTP_SESSION.get(url, headers=REQUEST_HEADERS, timeout=20)
         response.raise_for_status()
         target = POSTER_CACHE_DIR / f"{image_id}.jpg"
         target.write_bytes(response.content)
         return str(target)
 
 
+class _ProgressReader:
+    """Counts bytes pulled through a raw HTTP stream and reports the running total.
+
+    Reports are throttled to roughly 30 per second so a fast download does not
+    flood the GUI thread with progress signals; the final total is always
+    reported when the stream ends.
+    """
+
+    def __init__(self, raw, progress_callback):
+        self._raw = raw
+        self._progress_callback = progress_callback
+        self._done = 0
+        self._last_report = 0.0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._raw.read(size)
+        if chunk:
+            self._done += len(chunk)
+            now = time.monotonic()
+            if now - self._last_report >= 0.033:
+                self._last_report = now
+                self._progress_callback(self._done)
+        else:
+            self._progress_callback(self._done)
+        return chunk
+
+
 class ProtonManager(QObject):
     remoteReady = Signal(list)
     installedReady = Signal(list)
@@ -1274,6 +1558,8 @@ class ProtonManager(QObject):
         super().__init__()
         self.config = config
         self.logger = logger
+        self._releases_etag, self._cached_releases = self._load_release_cache()
+        self._fetch_thread: Optional[threading.Thread] = None
         self.refresh_directory()
 
     def refresh_directory(self) -> None:
@@ -1281,7 +1567,10 @@ class ProtonManager(QObject):
         self.proton_dir.mkdir(parents=True, exist_ok=True)
 
     def query_remote(self) -> None:
-        threading.Thread(target=self._fetch_remote_async, daemon=True).start()
+        if self._fetch_thread is not None and self._fetch_thread.is_alive():
+            return
+        self._fetch_thread = threading.Thread(target=self._fetch_remote_async, daemon=True)
+        self._fetch_thread.start()
 
     def query_installed(self) -> None:
         threading.Thread(target=self._emit_installed, daemon=True).start()
@@ -1297,8 +1586,13 @@ class ProtonManager(QObject):
         return exe if exe.exists() else None
 
     def _emit_installed(self) -> None:
+        tags = []
         try:
-            tags = sorted(path.name for path in self.proton_dir.iterdir() if (path / "proton").exists())
+            with os.scandir(self.proton_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False) and os.path.isfile(os.path.join(entry.path, "proton")):
+                        tags.append(entry.name)
+            tags.sort()
         except Exception:
             tags = []
         _safe_emit(self.installedReady, tags)
@@ -1306,9 +1600,55 @@ class ProtonManager(QObject):
     def _fetch_remote_async(self) -> None:
         _safe_emit(self.remoteReady, self._fetch_remote_sync())
 
+    def _load_release_cache(self) -> tuple[str, list[ProtonRelease]]:
+        try:
+            raw = json.loads(RELEASES_CACHE_FILE.read_text(encoding="utf-8"))
+            releases = [
+                ProtonRelease(
+                    tag=entry["tag"],
+                    name=entry["name"],
+                    published=datetime.fromisoformat(entry["published"]),
+                    asset_url=entry["asset_url"],
+                )
+                for entry in raw.get("releases", [])
+            ]
+            return str(raw.get("etag", "")), releases
+        except Exception:
+            return "", []
+
+    def _save_release_cache(self, etag: str, releases: list[ProtonRelease]) -> None:
+        try:
+            CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+            RELEASES_CACHE_FILE.write_text(
+                json.dumps(
+                    {
+                        "etag": etag,
+                        "releases": [
+                            {
+                                "tag": release.tag,
+                                "name": release.name,
+                                "published": release.published.isoformat(),
+                                "asset_url": release.asset_url,
+                            }
+                            for release in releases
+                        ],
+                    },
+                    indent=2,
+                ),
+                encoding="utf-8",
+            )
+        except Exception as error:
+            self.logger.add("WARNING", f"Could not write the release cache: {error}", "ProtonManager")
+
     def _fetch_remote_sync(self) -> list[ProtonRelease]:
+        headers = dict(REQUEST_HEADERS)
+        if self._releases_etag and self._cached_releases:
+            headers["If-None-Match"] = self._releases_etag
         try:
-            response = requests.get(GITHUB_API, headers=REQUEST_HEADERS, timeout=20)
+            response = _HTTP_SESSION.get(GITHUB_API, headers=headers, timeout=20)
+            if response.status_code == 304:
+                self.logger.add("INFO", f"Proton releases unchanged, using {len(self._cached_releases)} cached entries", "ProtonManager")
+                return list(self._cached_releases)
             response.raise_for_status()
             releases: list[ProtonRelease] = []
             for entry in response.json():
@@ -1326,6 +1666,10 @@ class ProtonManager(QObject):
                         asset_url=asset["browser_download_url"],
                     )
                 )
+            self._releases_etag = response.headers.get("ETag", "")
+            self._cached_releases = releases
+            if self._releases_etag:
+                self._save_release_cache(self._releases_etag, releases)
             self.logger.add("INFO", f"Fetched {len(releases)} Proton releases", "ProtonManager")
             return releases
         except Exception as error:
@@ -1344,32 +1688,33 @@ class ProtonManager(QObject):
             _safe_emit(self.downloadFinished, tag, True, "Already installed")
             return
 
-        archive_fd, archive_path = tempfile.mkstemp(suffix=".tar.gz")
-        os.close(archive_fd)
-
         try:
-            with requests.get(release.asset_url, headers=REQUEST_HEADERS, stream=True, timeout=30) as response:
-                response.raise_for_status()
+            response = _DOWNLOAD_POOL.request(
+                "GET",
+                release.asset_url,
+                headers=REQUEST_HEADERS,
+                preload_content=False,
+                decode_content=False,
+                timeout=urllib3.Timeout(connect=10, read=30),
+            )
+            try:
+                if response.status >= 400:
+                    raise RuntimeError(f"Download failed with HTTP {response.status}")
                 total = int(response.headers.get("Content-Length", 0))
-                done = 0
-                with open(archive_path, "wb") as handle:
-                    for chunk in response.iter_content(8192):
-                        if not chunk:
-                            continue
-                        handle.write(chunk)
-                        done += len(chunk)
-                        _safe_emit(self.downloadProgress, tag, done, total)
-
-            _safe_emit(self.installProgress, tag, "Extracting archive")
-            with tempfile.TemporaryDirectory(prefix="wine-manager-proton-") as staging_root:
-                self._extract_archive(pathlib.Path(archive_path), pathlib.Path(staging_root))
-                extracted = next(
-                    (path for path in pathlib.Path(staging_root).iterdir() if path.is_dir() and (path / "proton").exists()),
-                    None,
+                reader = _ProgressReader(
+                    response,
+                    lambda done: _safe_emit(self.downloadProgress, tag, done, total),
                 )
-                if extracted is None:
-                    raise RuntimeError("Archive does not contain a Proton build")
-                shutil.move(str(extracted), str(destination))
+
+                _safe_emit(self.installProgress, tag, "Downloading and extracting archive")
+                with tempfile.TemporaryDirectory(prefix="wine-manager-proton-") as staging_root:
+                    top_level = self._extract_stream(reader, pathlib.Path(staging_root))
+                    extracted = pathlib.Path(staging_root) / top_level if top_level else None
+                    if extracted is None or not (extracted / "proton").exists():
+                        raise RuntimeError("Archive does not contain a Proton build")
+                    shutil.move(str(extracted), str(destination))
+            finally:
+                response.release_conn()
 
             self.logger.add("INFO", f"Installed Proton {tag}", "ProtonManager")
             _safe_emit(self.downloadFinished, tag, True, "Installed")
@@ -1377,16 +1722,126 @@ class ProtonManager(QObject):
             shutil.rmtree(destination, ignore_errors=True)
             self.logger.add("ERROR", f"Could not install Proton {tag}: {error}", "ProtonManager")
             _safe_emit(self.downloadFinished, tag, False, str(error))
+
+    def _extract_stream(self, fileobj, staging_root: pathlib.Path) -> str:
+        if shutil.which("tar"):
+            return self._extract_with_tar(fileobj, staging_root)
+        return self._extract_with_tarfile(fileobj, staging_root)
+
+    def _extract_with_tar(self, fileobj, staging_root: pathlib.Path) -> str:
+        """Pipe the download through the system tar, which decompresses off the GIL.
+
+        GNU tar strips absolute paths and rejects members containing ".." by
+        default, so staging containment is preserved.
+        """
+        pigz = shutil.which("pigz")
+        if pigz:
+            command = ["tar", "-x", "--use-compress-program", pigz, "-C", str(staging_root)]
+        else:
+            command = ["tar", "-xz", "-C", str(staging_root)]
+        process = subprocess.Popen(command, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+        stderr_chunks: list[bytes] = []
+        # Drain stderr concurrently: a complaining tar can fill the pipe while
+        # we are still feeding stdin, deadlocking both processes.
+        stderr_reader = threading.Thread(
+            target=lambda: stderr_chunks.append(process.stderr.read()),
+            daemon=True,
+        )
+        stderr_reader.start()
+        try:
+            try:
+                shutil.copyfileobj(fileobj, process.stdin, length=256 * 1024)
+            finally:
+                process.stdin.close()
+        except BrokenPipeError:
+            pass
+        returncode = process.wait()
+        stderr_reader.join(timeout=10)
+        if returncode != 0:
+            detail = b"".join(stderr_chunks).decode("utf-8", "replace").strip()
+            raise RuntimeError(f"tar exited with status {returncode}: {detail}")
+
+        directories = sorted(
+            entry.name
+            for entry in os.scandir(staging_root)
+            if entry.is_dir(follow_symlinks=False)
+        )
+        if len(directories) > 1:
+            for name in directories:
+                if os.path.isfile(os.path.join(staging_root, name, "proton")):
+                    return name
+        return directories[0] if directories else ""
+
+    def _extract_with_tarfile(self, fileobj, staging_root: pathlib.Path) -> str:
+        staging_resolved = str(staging_root.resolve())
+        top_level = ""
+        jobs: queue.Queue = queue.Queue(maxsize=64)
+        errors: list[Exception] = []
+
+        def _write_files() -> None:
+            while True:
+                job = jobs.get()
+                if job is None:
+                    return
+                target, mode, mtime, data = job
+                try:
+                    descriptor = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+                    try:
+                        os.write(descriptor, data)
+                    finally:
+                        os.close(descriptor)
+                    os.utime(target, (mtime, mtime))
+                except Exception as error:
+                    errors.append(error)
+
+        workers = [
+            threading.Thread(target=_write_files, daemon=True)
+            for _ in range(min(4, os.cpu_count() or 1))
+        ]
+        for worker in workers:
+            worker.start()
+
+        if _igzip is not None:
+            fileobj = _igzip.IGzipFile(fileobj=fileobj)
+            tar_mode = "r|"
+        else:
+            tar_mode = "r|gz"
+
+        data_filter = getattr(tarfile, "data_filter", None)
+        try:
+            with tarfile.open(fileobj=fileobj, mode=tar_mode) as archive:
+                for member in archive:
+                    if errors:
+                        break
+                    if data_filter is not None:
+                        try:
+                            member = data_filter(member, staging_resolved)
+                        except tarfile.FilterError as error:
+                            raise RuntimeError(f"Archive contains an invalid path: {error}") from error
+                        target = os.path.join(staging_resolved, member.name)
+                    else:
+                        target = str((staging_root / member.name).resolve(strict=False))
+                        if not target.startswith(staging_resolved):
+                            raise RuntimeError("Archive contains an invalid path")
+                    if not top_level:
+                        top_level = member.name.lstrip("./").split("/", 1)[0]
+                    if member.isreg():
+                        source = archive.extractfile(member)
+                        if source is None:
+                            continue
+                        os.makedirs(os.path.dirname(target), exist_ok=True)
+                        jobs.put((target, member.mode, member.mtime, source.read()))
+                    else:
+                        archive.extract(member, staging_root)
         finally:
-            pathlib.Path(archive_path).unlink(missing_ok=True)
+            for _ in workers:
+                jobs.put(None)
+            for worker in workers:
+                worker.join()
 
-    def _extract_archive(self, archive_path: pathlib.Path, staging_root: pathlib.Path) -> None:
-        with tarfile.open(archive_path, "r:gz") as archive:
-            for member in archive.getmembers():
-                resolved = (staging_root / member.name).resolve(strict=False)
-                if not str(resolved).startswith(str(staging_root.resolve())):
-                    raise RuntimeError("Archive contains an invalid path")
-            archive.extractall(staging_root)
+        if errors:
+            raise errors[0]
+        return top_level
 
     def _uninstall(self, tag: str) -> None:
         destination = self.proton_dir / tag
@@ -1415,6 +1870,8 @@ class LaunchService:
         self.proton_manager = proton_manager
         self.config = config
         self.logger = logger
+        self._processes: list[subprocess.Popen] = []
+        self._base_env = os.environ.copy()
 
     def launch(
         self,
@@ -1424,8 +1881,7 @@ class LaunchService:
         gamescope_settings: GamescopeSettings | None = None,
         launch_args: list[str] | None = None,
     ) -> LaunchResult:
-        env = os.environ.copy()
-        env["WINEPREFIX"] = prefix
+        env: dict[str, str] = {"WINEPREFIX": prefix}
         launch_args = list(launch_args or [])
         if gamescope_settings is None:
             gamescope_settings = self.config.effective_gamescope(prefix, exe_path)
@@ -1455,23 +1911,42 @@ class LaunchService:
         else:
             command = base_command
 
-        process = subprocess.Popen(
-            command,
-            env=env,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
+        process_env = dict(self._base_env)
+        process_env.update(env)
+
+        app_name = pathlib.Path(exe_path).name
+        # Child output goes to unlinked spill files rather than pipes: hours of
+        # Wine spam land on disk instead of growing an in-process buffer, and a
+        # child that outlives the manager keeps a valid write target.
+        stdout_spill = tempfile.TemporaryFile(prefix="wine-manager-out-")
+        stderr_spill = tempfile.TemporaryFile(prefix="wine-manager-err-")
+        try:
+            # start_new_session detaches the child from our session, so closing
+            # the manager never takes a running game down with it.
+            process = subprocess.Popen(
+                command,
+                env=process_env,
+                stdout=stdout_spill,
+                stderr=stderr_spill,
+                start_new_session=True,
+            )
+        except OSError as error:
+            stdout_spill.close()
+            stderr_spill.close()
+            raise RuntimeError(f"Could not start {command[0]}: {error}") from error
+
+        self._processes.append(process)
+        threading.Thread(
+            target=self._watch_process,
+            args=(process, stdout_spill, stderr_spill, app_name, runtime_label),
+            daemon=True,
+        ).start()
+
         self.logger.add(
             "INFO",
-            f"Launched {pathlib.Path(exe_path).name} via {runtime_label} (PID {process.pid})",
+            f"Launched {app_name} via {runtime_label} (PID {process.pid})",
             "Launcher",
         )
-        threading.Thread(
-            target=self._capture_output,
-            args=(process, pathlib.Path(exe_path).name, runtime_label),
-            daemon=True,
-        ).start()
         return LaunchResult(pid=process.pid, command=command, runtime_label=runtime_label)
 
     @staticmethod
@@ -1494,7 +1969,8 @@ class LaunchService:
                 "or switch the Proton launch backend to legacy direct mode in Settings."
             )
         env["GAMEID"] = self._game_id(exe_path)
-        env.setdefault("STORE", "none")
+        if "STORE" not in self._base_env:
+            env["STORE"] = "none"
         env["PROTONPATH"] = str(proton_path)
         command = [umu_executable, exe_path] + launch_args
         return command, f"Proton {runtime_tag} via umu-run"
@@ -1509,22 +1985,43 @@ class LaunchService:
         proton_exe: pathlib.Path,
     ) -> tuple[list[str], str]:
         env["STEAM_COMPAT_DATA_PATH"] = prefix
-        env.setdefault("STEAM_COMPAT_CLIENT_INSTALL_PATH", "/usr")
+        if "STEAM_COMPAT_CLIENT_INSTALL_PATH" not in self._base_env:
+            env["STEAM_COMPAT_CLIENT_INSTALL_PATH"] = "/usr"
         command = [str(proton_exe), "run", exe_path] + launch_args
         return command, f"Proton {runtime_tag} direct legacy"
 
-    def _capture_output(self, process: subprocess.Popen, app_name: str, runtime_label: str) -> None:
+    def _watch_process(
+        self,
+        process: subprocess.Popen,
+        stdout_spill,
+        stderr_spill,
+        app_name: str,
+        runtime_label: str,
+    ) -> None:
+        process.wait()
+        stdout = self._read_spill_tail(stdout_spill)
+        stderr = self._read_spill_tail(stderr_spill)
+
+        if stdout:
+            self.logger.add("INFO", stdout, runtime_label)
+        if stderr:
+            level = "ERROR" if _ERROR_TOKENS_RE.search(stderr) else "WARNING"
+            self.logger.add(level, stderr, runtime_label)
+
         try:
-            stdout, stderr = process.communicate(timeout=20)
-        except subprocess.TimeoutExpired:
-            self.logger.add("INFO", f"{app_name} is still running", runtime_label)
-            return
-        except Exception as error:
-            self.logger.add("WARNING", f"Could not monitor {app_name}: {error}", runtime_label)
-            return
+            self._processes.remove(process)
+        except ValueError:
+            pass
+
+    OUTPUT_TAIL_BYTES = 64 * 1024
 
-        if stdout.strip():
-            self.logger.add("INFO", stdout.strip(), runtime_label)
-        if stderr.strip():
-            level = "ERROR" if any(token in stderr.lower() for token in ["error", "failed", "exception"]) else "WARNING"
-            self.logger.add(level, stderr.strip(), runtime_label)
\ No newline at end of file
+    @classmethod
+    def _read_spill_tail(cls, spill) -> str:
+        try:
+            size = spill.seek(0, os.SEEK_END)
+            spill.seek(max(0, size - cls.OUTPUT_TAIL_BYTES))
+            return spill.read().decode("utf-8", errors="replace").strip()
+        except (OSError, ValueError):
+            return ""
+        finally:
+            spill.close()
\ No newline at end of file
@@ -24,6 +24,9 @@ LOG_LEVEL_COLORS = {
 }
 
 
+_stylesheet_cache = ""
+
+
 def apply_theme(app: QApplication) -> None:
     app.setStyle("Fusion")
     app.setFont(QFont("Cantarell", 10))
@@ -64,7 +67,10 @@ def _build_palette() -> QPalette:
 
 
 def _build_stylesheet() -> str:
-    return """
+    global _stylesheet_cache
+    if _stylesheet_cache:
+        return _stylesheet_cache
+    _stylesheet_cache = """
         QWidget {{
             color: {text};
             font-family: Cantarell, "Segoe UI", sans-serif;
@@ -606,4 +612,5 @@ def _build_stylesheet() -> str:
             width: 0;
             height: 0;
         }}
-    """.format_map(THEME_COLORS)
\ No newline at end of file
+    """.format_map(THEME_COLORS)
+    return _stylesheet_cache
\ No newline at end of file
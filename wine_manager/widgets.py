@@ -384,7 +384,7 @@ class AppCard(QFrame):
         self.meta_chip.setText(meta)
         self.prefix_chip.setText(prefix)
         self.setToolTip(tooltip)
-        self.path_label.setText(tooltip.split("\n", 1)[0])
+        self.path_label.setText(exe_path)
         if art_path and is_favorite:
             self.summary_label.setText("Custom artwork is applied and the app is pinned as a favorite.")
         elif art_path: